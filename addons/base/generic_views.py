@@ -38,7 +38,7 @@ def import_auth(addon_short_name, Serializer):
         node_addon.save()
 
         return {
-            'result': Serializer().serialize_settings(node_addon, auth.user),
+            'result': Serializer(user_settings=user_addon).serialize_settings(node_addon, auth.user),
             'message': 'Successfully imported access token from profile.',
         }
     _import_auth.__name__ = '{0}_import_auth'.format(addon_short_name)
@@ -746,7 +746,7 @@ class BaseOAuthNodeSettings(BaseNodeSettings):
         """
         self.clear_auth()
 
-    def clear_auth(self):
+    def clear_auth(self, save=True):
         """Disconnect the node settings from the user settings.
 
         This method does not remove the node's permission in the user's addon
@@ -754,7 +754,8 @@ class BaseOAuthNodeSettings(BaseNodeSettings):
         """
         self.external_account = None
         self.user_settings = None
-        self.save()
+        if save:
+            self.save()
 
     def before_remove_contributor_message(self, node, removed):
         """If contributor to be removed authorized this addon, warn that removing
@@ -10,6 +10,7 @@ from osf.models.files import File, Folder, BaseFileNode
 from osf.utils.permissions import WRITE
 from framework.auth.core import _get_current_user
 from addons.base import exceptions
+from addons.dataverse import settings
 from addons.dataverse.client import connect_from_settings_or_401
 from addons.dataverse.serializer import DataverseSerializer
 from addons.dataverse.utils import DataverseNodeLogger
@@ -57,6 +58,8 @@ class DataverseFile(DataverseFileNode, File):
 
 class DataverseProvider(object):
     """An alternative to `ExternalProvider` not tied to OAuth"""
+    __slots__ = ('account',)
+
     name = 'Dataverse'
     short_name = 'dataverse'
     serializer = DataverseSerializer
@@ -98,9 +101,12 @@ class NodeSettings(BaseOAuthNodeSettings, BaseStorageAddon):
         if self._dataset_id is None and (self.dataverse_alias and self.dataset_doi):
             connection = connect_from_settings_or_401(self)
             dataverse = connection.get_dataverse(self.dataverse_alias)
-            dataset = dataverse.get_dataset_by_doi(self.dataset_doi)
-            self._dataset_id = dataset.id
-            self.save()
+            dataset = dataverse.get_dataset_by_doi(self.dataset_doi, timeout=settings.REQUEST_TIMEOUT)
+            if dataset.id is not None:
+                # The resolved id is kept on the instance, so later reads skip the
+                # Dataverse round-trip; only that column needs to be written
+                self._dataset_id = dataset.id
+                self.save(update_fields=['_dataset_id'])
         return self._dataset_id
 
     @property
@@ -167,7 +173,8 @@ class NodeSettings(BaseOAuthNodeSettings, BaseStorageAddon):
     def deauthorize(self, auth=None, add_log=True):
         """Remove user authorization from this node and log the event."""
         self.clear_settings()
-        self.clear_auth()  # Also performs a save
+        self.clear_auth(save=False)
+        self.save()
 
         # Log can't be added without auth
         if add_log and auth:
@@ -197,18 +204,19 @@ class NodeSettings(BaseOAuthNodeSettings, BaseStorageAddon):
         }
 
     def create_waterbutler_log(self, auth, action, metadata):
-        url = self.owner.web_url_for('addon_view_or_download_file', path=metadata['path'], provider='dataverse')
-        self.owner.add_log(
+        owner = self.owner
+        url = owner.web_url_for('addon_view_or_download_file', path=metadata['path'], provider='dataverse')
+        owner.add_log(
             'dataverse_{0}'.format(action),
             auth=auth,
             params={
-                'project': self.owner.parent_id,
-                'node': self.owner._id,
+                'project': owner.parent_id,
+                'node': owner._id,
                 'dataset': self.dataset,
                 'filename': metadata['materialized'].strip('/'),
                 'urls': {
                     'view': url,
-                    'download': url + '?action=download'
+                    'download': '{0}?action=download'.format(url),
                 },
             },
         )
@@ -217,8 +225,6 @@ class NodeSettings(BaseOAuthNodeSettings, BaseStorageAddon):
 
     def after_delete(self, user):
         self.deauthorize(Auth(user=user), add_log=True)
-        self.save()
 
     def on_delete(self):
         self.deauthorize(add_log=False)
-        self.save()
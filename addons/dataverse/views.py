@@ -107,11 +107,6 @@ def dataverse_add_user_account(auth, **kwargs):
     if not user.external_accounts.filter(id=provider.account.id).exists():
         user.external_accounts.add(provider.account)
 
-    user_addon = auth.user.get_addon('dataverse')
-    if not user_addon:
-        user.add_addon('dataverse')
-    user.save()
-
     # Need to ensure that the user has dataverse enabled at this point
     user.get_or_add_addon('dataverse', auth=auth)
     user.save()
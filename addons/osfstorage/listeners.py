@@ -4,7 +4,7 @@ Listens for actions to be done to OSFstorage file nodes specifically.
 from django.apps import apps
 from django.db import transaction
 
-from website.project.signals import contributor_removed, node_deleted
+from website.project.signals import contributor_removed, contributor_removed_bulk, node_deleted
 from framework.celery_tasks import app
 from framework.postcommit_tasks.handlers import enqueue_postcommit_task
 
@@ -16,8 +16,22 @@ def checkin_files_by_user(node, user):
     enqueue_postcommit_task(checkin_files_task, (node._id, user._id, ), {}, celery=True)
 
 
+@contributor_removed_bulk.connect
+def checkin_files_by_users(node, user_ids):
+    """ Listens to several group members being removed at once to check in all of their files
+    """
+    enqueue_postcommit_task(checkin_files_for_users_task, (node._id, list(user_ids), ), {}, celery=True)
+
+
 @app.task(max_retries=5, default_retry_delay=60)
 def checkin_files_task(node_id, user_id):
+    OSFUser = apps.get_model('osf.OSFUser')
+    user_ids = list(OSFUser.objects.filter(guids___id=user_id).values_list('id', flat=True))
+    checkin_files_for_users_task(node_id, user_ids)
+
+
+@app.task(max_retries=5, default_retry_delay=60)
+def checkin_files_for_users_task(node_id, user_ids):
     with transaction.atomic():
         AbstractNode = apps.get_model('osf.AbstractNode')
         Preprint = apps.get_model('osf.Preprint')
@@ -26,12 +40,15 @@ def checkin_files_task(node_id, user_id):
 
         node = Guid.load(node_id).referent
         assert isinstance(node, (AbstractNode, Preprint))
-        user = OSFUser.load(user_id)
 
-        # If user doesn't have any permissions through their OSF group or through contributorship,
-        # check their files back in
-        if not node.is_contributor_or_group_member(user):
-            node.files.filter(checkout=user).update(checkout=None)
+        # Check in files for users that no longer have any permissions through their
+        # OSF group or through contributorship
+        users = [
+            user for user in OSFUser.objects.filter(id__in=user_ids)
+            if not node.is_contributor_or_group_member(user)
+        ]
+        if users:
+            node.files.filter(checkout__in=users).update(checkout=None)
 
 
 @node_deleted.connect
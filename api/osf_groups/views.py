@@ -218,7 +218,13 @@ class GroupMembersList(OSFGroupMemberBaseView, bulk_views.BulkUpdateJSONAPIView,
 
     @require_flag(OSF_GROUPS)
     def perform_create(self, serializer):
-        return super(GroupMembersList, self).perform_create(serializer)
+        with OSFGroup.log_batch():
+            return super(GroupMembersList, self).perform_create(serializer)
+
+    # Overrides BulkDestroyJSONAPIView
+    def perform_bulk_destroy(self, objects):
+        with OSFGroup.log_batch():
+            return super(GroupMembersList, self).perform_bulk_destroy(objects)
 
 
 class GroupMemberDetail(OSFGroupMemberBaseView, generics.RetrieveUpdateDestroyAPIView, UserMixin):
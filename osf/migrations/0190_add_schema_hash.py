@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+import hashlib
+import json
+
+from django.db import migrations, models
+
+
+def get_schema_hash(schema):
+    # Frozen copy of osf.models.metaschema.get_schema_hash
+    return hashlib.sha256(json.dumps(schema, sort_keys=True).encode('utf-8')).hexdigest()
+
+
+def populate_schema_hash(state, schema_editor):
+    for model_name in ('registrationschema', 'filemetadataschema'):
+        Schema = state.get_model('osf', model_name)
+        for schema in Schema.objects.all().only('id', 'schema'):
+            Schema.objects.filter(id=schema.id).update(schema_hash=get_schema_hash(schema.schema))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('osf', '0189_deleted_field_data'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='filemetadataschema',
+            name='schema_hash',
+            field=models.CharField(blank=True, db_index=True, max_length=64, null=True),
+        ),
+        migrations.AddField(
+            model_name='registrationschema',
+            name='schema_hash',
+            field=models.CharField(blank=True, db_index=True, max_length=64, null=True),
+        ),
+        migrations.RunPython(populate_schema_hash, migrations.RunPython.noop),
+    ]
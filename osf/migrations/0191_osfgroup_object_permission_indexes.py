@@ -0,0 +1,22 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    atomic = False  # CREATE INDEX CONCURRENTLY cannot be run in a txn
+
+    dependencies = [
+        ('osf', '0190_add_schema_hash'),
+    ]
+
+    operations = [
+        migrations.RunSQL([
+            'CREATE INDEX CONCURRENTLY osf_osfgroupgroupobjperm_group_obj_perm ON osf_osfgroupgroupobjectpermission (group_id, content_object_id, permission_id);',
+            'CREATE INDEX CONCURRENTLY osf_osfgroupuserobjperm_user_obj_perm ON osf_osfgroupuserobjectpermission (user_id, content_object_id, permission_id);',
+        ], [
+            'DROP INDEX IF EXISTS osf_osfgroupgroupobjperm_group_obj_perm, RESTRICT;',
+            'DROP INDEX IF EXISTS osf_osfgroupuserobjperm_user_obj_perm, RESTRICT;',
+        ])
+    ]
@@ -0,0 +1,20 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    atomic = False  # CREATE INDEX CONCURRENTLY cannot be run in a txn
+
+    dependencies = [
+        ('osf', '0191_osfgroup_object_permission_indexes'),
+    ]
+
+    operations = [
+        migrations.RunSQL([
+            'CREATE INDEX CONCURRENTLY osf_basefilenode_target_path ON osf_basefilenode (target_content_type_id, target_object_id, _path);',
+        ], [
+            'DROP INDEX IF EXISTS osf_basefilenode_target_path, RESTRICT;',
+        ])
+    ]
@@ -1,5 +1,11 @@
 # -*- coding: utf-8 -*-
+import hashlib
+import json
+from collections import OrderedDict
+
 from django.db import models
+from django.db.models import OuterRef, Subquery
+from django.utils.functional import cached_property
 import jsonschema
 
 from website.util import api_v2_url
@@ -10,6 +16,44 @@ from osf.exceptions import ValidationValueError, ValidationError
 
 from website.project.metadata.utils import create_jsonschema_from_metaschema
 
+# Compiled jsonschema validators, keyed by (schema hash, required_fields, reviewer)
+_COMPILED_VALIDATORS = {}
+_COMPILED_VALIDATORS_MAX_SIZE = 256
+
+
+def get_schema_hash(schema):
+    """
+    Return a hash of the canonical JSON of a metaschema, so that equal schemas
+    share the same hash regardless of key order.
+    """
+    return hashlib.sha256(json.dumps(schema, sort_keys=True).encode('utf-8')).hexdigest()
+
+
+def _get_compiled_validator(schema, required_fields, reviewer):
+    """
+    Return a jsonschema validator for the given RegistrationSchema, building and
+    meta-validating the generated jsonschemas only the first time the schema is seen.
+
+    The validators for all four (required_fields, reviewer) combinations are built
+    together, so switching modes on an already-seen schema never rebuilds.
+    """
+    schema_hash = schema.schema_hash or get_schema_hash(schema.schema)
+    key = (schema_hash, bool(required_fields), bool(reviewer))
+    validator = _COMPILED_VALIDATORS.get(key)
+    if validator is None:
+        if len(_COMPILED_VALIDATORS) + 4 > _COMPILED_VALIDATORS_MAX_SIZE:
+            _COMPILED_VALIDATORS.clear()
+        for mode_required_fields in (True, False):
+            for mode_reviewer in (True, False):
+                json_schema = create_jsonschema_from_metaschema(schema.schema,
+                                                                required_fields=mode_required_fields,
+                                                                is_reviewer=mode_reviewer)
+                cls = jsonschema.validators.validator_for(json_schema)
+                cls.check_schema(json_schema)
+                _COMPILED_VALIDATORS[(schema_hash, mode_required_fields, mode_reviewer)] = cls(json_schema)
+        validator = _COMPILED_VALIDATORS[key]
+    return validator
+
 
 class AbstractSchemaManager(models.Manager):
     def get_latest_version(self, name, only_active=True):
@@ -19,11 +63,7 @@ class AbstractSchemaManager(models.Manager):
         :return schema
         """
         schemas = self.filter(name=name, active=True) if only_active else self.filter(name=name)
-        sorted_schemas = schemas.order_by('schema_version')
-        if sorted_schemas:
-            return sorted_schemas.last()
-        else:
-            return None
+        return schemas.order_by('-schema_version').first()
 
     def get_latest_versions(self, only_active=True):
         """
@@ -34,11 +74,16 @@ class AbstractSchemaManager(models.Manager):
         latest_schemas = self.filter(visible=True)
         if only_active:
             latest_schemas = latest_schemas.filter(active=True)
-        return latest_schemas.order_by('name', '-schema_version').distinct('name')
+        latest_version = latest_schemas.filter(
+            name=OuterRef('name')
+        ).order_by('-schema_version').values('schema_version')[:1]
+        return latest_schemas.filter(schema_version=Subquery(latest_version)).order_by('name')
 
 class AbstractSchema(ObjectIDMixin, BaseModel):
     name = models.CharField(max_length=255)
     schema = DateTimeAwareJSONField(default=dict)
+    # Kept current by save() and by ensure_schemas, which writes through historical models
+    schema_hash = models.CharField(max_length=64, db_index=True, blank=True, null=True)
     category = models.CharField(max_length=255, null=True, blank=True)
     active = models.BooleanField(default=True)  # whether or not the schema accepts submissions
     visible = models.BooleanField(default=True)  # whether or not the schema should be visible in the API and registries search
@@ -48,6 +93,9 @@ class AbstractSchema(ObjectIDMixin, BaseModel):
 
     objects = AbstractSchemaManager()
 
+    # cached_properties computed from `schema`
+    _schema_cached_properties = ()
+
     class Meta:
         abstract = True
         unique_together = ('name', 'schema_version')
@@ -55,9 +103,37 @@ class AbstractSchema(ObjectIDMixin, BaseModel):
     def __unicode__(self):
         return '(name={}, schema_version={}, id={})'.format(self.name, self.schema_version, self.id)
 
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get('update_fields')
+        if update_fields is None or 'schema' in update_fields:
+            self.schema_hash = get_schema_hash(self.schema)
+            # Drop anything derived from the previous schema
+            for cached in self._schema_cached_properties:
+                self.__dict__.pop(cached, None)
+            if update_fields is not None and 'schema_hash' not in update_fields:
+                kwargs['update_fields'] = list(update_fields) + ['schema_hash']
+        return super(AbstractSchema, self).save(*args, **kwargs)
+
 
 class RegistrationSchema(AbstractSchema):
+    _schema_cached_properties = ('_qid_index', '_config')
+
+    @cached_property
+    def _qid_index(self):
+        """
+        Mapping of qid to question, in schema order.
+        """
+        index = OrderedDict()
+        for page in self.schema.get('pages', []):
+            for question in page['questions']:
+                index.setdefault(question['qid'], question)
+        return index
+
     @property
+    def _first_question(self):
+        return next(iter(self._qid_index.values()), None)
+
+    @cached_property
     def _config(self):
         return self.schema.get('config', {})
 
@@ -97,32 +173,32 @@ class RegistrationSchema(AbstractSchema):
         """
         Validates registration_metadata field.
         """
-        schema = create_jsonschema_from_metaschema(self.schema,
-                                                   required_fields=required_fields,
-                                                   is_reviewer=reviewer)
         try:
-            jsonschema.validate(metadata, schema)
+            validator = _get_compiled_validator(self, required_fields, reviewer)
+            validator.validate(metadata)
         except jsonschema.ValidationError as e:
-            for page in self.schema['pages']:
-                for question in page['questions']:
-                    if e.relative_schema_path[0] == 'required':
-                        raise ValidationError(
-                            'For your registration the \'{}\' field is required'.format(question['title'])
-                        )
-                    elif e.relative_schema_path[0] == 'additionalProperties':
-                        raise ValidationError(
-                            'For your registration the \'{}\' field is extraneous and not permitted in your response.'.format(question['qid'])
-                        )
-                    elif e.relative_path[0] == question['qid']:
-                        if 'options' in question:
-                            raise ValidationError(
-                                'For your registration your response to the \'{}\' field is invalid, your response must be one of the provided options.'.format(
-                                    question['title'],
-                                ),
-                            )
+            question_index = self._qid_index
+            if question_index:
+                failed_keyword = e.relative_schema_path[0] if e.relative_schema_path else None
+                if failed_keyword == 'required':
+                    raise ValidationError(
+                        'For your registration the \'{}\' field is required'.format(self._first_question['title'])
+                    )
+                elif failed_keyword == 'additionalProperties':
+                    raise ValidationError(
+                        'For your registration the \'{}\' field is extraneous and not permitted in your response.'.format(self._first_question['qid'])
+                    )
+                question = question_index.get(e.relative_path[0]) if e.relative_path else None
+                if question is not None:
+                    if 'options' in question:
                         raise ValidationError(
-                            'For your registration your response to the \'{}\' field is invalid.'.format(question['title']),
+                            'For your registration your response to the \'{}\' field is invalid, your response must be one of the provided options.'.format(
+                                question['title'],
+                            ),
                         )
+                    raise ValidationError(
+                        'For your registration your response to the \'{}\' field is invalid.'.format(question['title']),
+                    )
             raise ValidationError(e)
         except jsonschema.SchemaError as e:
             raise ValidationValueError(e)
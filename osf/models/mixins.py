@@ -85,13 +85,23 @@ class Loggable(models.Model):
     last_logged = NonNaiveDateTimeField(db_index=True, null=True, blank=True, default=timezone.now)
 
     def add_log(self, action, params, auth, foreign_user=None, log_date=None, save=True, request=None):
-        AbstractNode = apps.get_model('osf.AbstractNode')
         user = None
         if auth:
             user = auth.user
         elif request:
             user = request.user
 
+        log = self._build_log(action, params, user, foreign_user=foreign_user, log_date=log_date)
+        log.save()
+
+        self._complete_add_log(log, action, user, save)
+
+        return log
+
+    def _build_log(self, action, params, user, foreign_user=None, log_date=None):
+        """Return an unsaved NodeLog for this object.
+        """
+        AbstractNode = apps.get_model('osf.AbstractNode')
         params['node'] = params.get('node') or params.get('project') or self._id
         original_node = self if self._id == params['node'] else AbstractNode.load(params.get('node'))
 
@@ -102,10 +112,6 @@ class Loggable(models.Model):
 
         if log_date:
             log.date = log_date
-        log.save()
-
-        self._complete_add_log(log, action, user, save)
-
         return log
 
     def _complete_add_log(self, log, action, user=None, save=True):
@@ -117,6 +123,11 @@ class Loggable(models.Model):
             log_date = recent_log.date if hasattr(log, 'date') else recent_log.created
             self.last_logged = log_date
 
+        self._finish_add_log(action, user, save)
+
+    def _finish_add_log(self, action, user=None, save=True):
+        """Save this object and count the user's activity once last_logged is set.
+        """
         if save:
             self.save()
         if user and not getattr(self, 'is_collection', None):
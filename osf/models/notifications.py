@@ -74,18 +74,23 @@ class NotificationSubscription(BaseModel):
             self.save()
 
     def remove_user_from_subscription(self, user, save=True):
+        self.remove_users_from_subscription([user], save=save)
+
+    def remove_users_from_subscription(self, users, save=True):
         for notification_type in NOTIFICATION_TYPES:
-            try:
-                getattr(self, notification_type, []).remove(user)
-            except ValueError:
-                pass
+            getattr(self, notification_type).remove(*users)
 
         if isinstance(self.owner, Node) and self.owner.parent_node:
-            try:
-                self.owner.parent_node.child_node_subscriptions.get(user._id, []).remove(self.owner._id)
-                self.owner.parent_node.save()
-            except ValueError:
-                pass
+            parent_node = self.owner.parent_node
+            removed = False
+            for user in users:
+                try:
+                    parent_node.child_node_subscriptions.get(user._id, []).remove(self.owner._id)
+                    removed = True
+                except ValueError:
+                    pass
+            if removed:
+                parent_node.save()
 
         if save:
             self.save()
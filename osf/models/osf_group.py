@@ -1,17 +1,26 @@
 import logging
 import functools
+import re
+import threading
+from contextlib import contextmanager
+
 from django.apps import apps
 from django.core.exceptions import ValidationError
 from django.db import models
 from django.db.models.signals import post_save
 from django.dispatch import receiver
-from guardian.shortcuts import assign_perm, remove_perm, get_perms, get_objects_for_group, get_group_perms
+from django.utils import timezone
+from django.utils.functional import cached_property
+from django.contrib.auth.models import Permission
+from django.contrib.contenttypes.models import ContentType
+from guardian.shortcuts import get_objects_for_group, get_group_perms
 from guardian.models import GroupObjectPermissionBase, UserObjectPermissionBase
+from guardian.utils import get_group_obj_perms_model
 
 from framework.exceptions import PermissionsError
 from framework.auth.core import get_user, Auth
 from framework.sentry import log_exception
-from osf.exceptions import BlacklistedEmailError
+from osf.exceptions import BlacklistedEmailError, ValidationError as OSFValidationError
 from osf.models import base
 from osf.models.mixins import GuardianMixin, Loggable
 from osf.models import Node, OSFUser, NodeLog
@@ -25,6 +34,13 @@ from website.util import api_v2_url
 
 logger = logging.getLogger(__name__)
 
+# Characters that bleach would strip, escape, or normalize, including the
+# control characters it replaces with '?'
+HTML_SPECIAL_CHARS_RE = re.compile(r'[<>&\x00-\x08\x0b\x0c\x0e-\x1f\r]')
+
+# Logs buffered by OSFGroup.log_batch, per thread
+_log_buffer = threading.local()
+
 
 class OSFGroup(GuardianMixin, Loggable, base.ObjectIDMixin, base.BaseModel):
     """
@@ -62,14 +78,14 @@ class OSFGroup(GuardianMixin, Loggable, base.ObjectIDMixin, base.BaseModel):
     def _primary_key(self):
         return self._id
 
-    @property
+    @cached_property
     def manager_group(self):
         """
         OSFGroup's Django manager group object
         """
         return self.get_group(MANAGER)
 
-    @property
+    @cached_property
     def member_group(self):
         """
         OSFGroup's Django member group object
@@ -115,12 +131,27 @@ class OSFGroup(GuardianMixin, Loggable, base.ObjectIDMixin, base.BaseModel):
     def is_member(self, user):
         # Checking group membership instead of permissions, because unregistered
         # members have no perms
-        return user in self.members
+        if not user:
+            return False
+        return self.member_group.user_set.filter(id=user.id).exists()
 
     def is_manager(self, user):
         # Checking group membership instead of permissions, because unregistered
         # members have no perms
-        return user in self.managers
+        if not user:
+            return False
+        return self.manager_group.user_set.filter(id=user.id).exists()
+
+    def _role_of(self, user):
+        """
+        Returns the user's role in the group - MANAGER, MEMBER, or None if the
+        user does not belong to the group
+        """
+        if self.is_manager(user):
+            return MANAGER
+        if self.is_member(user):
+            return MEMBER
+        return None
 
     def _require_manager_permission(self, auth=None):
         if auth and not self.has_permission(auth.user, MANAGE):
@@ -132,7 +163,7 @@ class OSFGroup(GuardianMixin, Loggable, base.ObjectIDMixin, base.BaseModel):
 
     def _enforce_one_manager(self, user):
         # Group must have at least one registered manager
-        if (len(self.managers) == 1 and self.managers[0] == user) or not self.managers.filter(is_registered=True).exclude(id=user.id):
+        if not self.managers.filter(is_registered=True).exclude(id=user.id).exists():
             raise ValueError('Group must have at least one manager.')
 
     def _get_node_group_perms(self, node, permission):
@@ -147,6 +178,38 @@ class OSFGroup(GuardianMixin, Loggable, base.ObjectIDMixin, base.BaseModel):
             raise ValueError('{} is not a valid permission.'.format(permission))
         return permissions
 
+    def _assign_node_perms(self, node, permissions):
+        """
+        Gives the member group the given permissions to the node in a single INSERT.
+        Assumes the member group doesn't already have any of the permissions.
+        """
+        if not permissions:
+            return
+        GroupObjectPermission = get_group_obj_perms_model(node)
+        content_type = ContentType.objects.get_for_model(node)
+        perms = list(Permission.objects.filter(content_type=content_type, codename__in=permissions))
+        missing = set(permissions) - set(perm.codename for perm in perms)
+        if missing:
+            # Matches guardian's assign_perm, rather than leaving the group with partial permissions
+            raise Permission.DoesNotExist('Permission(s) {} do not exist'.format(', '.join(sorted(missing))))
+        GroupObjectPermission.objects.bulk_create([
+            GroupObjectPermission(group=self.member_group, permission=perm, content_object=node)
+            for perm in perms
+        ])
+
+    def _remove_node_perms(self, node, permissions):
+        """
+        Removes the given permissions to the node from the member group in a single DELETE.
+        """
+        if not permissions:
+            return
+        GroupObjectPermission = get_group_obj_perms_model(node)
+        GroupObjectPermission.objects.filter(
+            group=self.member_group,
+            content_object=node,
+            permission__codename__in=permissions
+        ).delete()
+
     def send_member_email(self, user, permission, auth=None):
         group_signals.member_added.send(self, user=user, permission=permission, auth=auth)
 
@@ -158,12 +221,12 @@ class OSFGroup(GuardianMixin, Loggable, base.ObjectIDMixin, base.BaseModel):
         """
         self._require_manager_permission(auth)
         self._disabled_user_check(user)
-        adding_member = not self.is_member(user)
-        if user in self.members_only:
+        role = self._role_of(user)
+        if role == MEMBER:
             return False
 
         self.member_group.user_set.add(user)
-        if self.is_manager(user):
+        if role == MANAGER:
             self._enforce_one_manager(user)
             self.manager_group.user_set.remove(user)
             self.add_role_updated_log(user, MEMBER, auth)
@@ -177,7 +240,7 @@ class OSFGroup(GuardianMixin, Loggable, base.ObjectIDMixin, base.BaseModel):
                 auth=auth)
         self.update_search()
 
-        if adding_member:
+        if role is None:
             self.send_member_email(user, MEMBER, auth)
 
     def make_manager(self, user, auth=None):
@@ -188,11 +251,11 @@ class OSFGroup(GuardianMixin, Loggable, base.ObjectIDMixin, base.BaseModel):
         """
         self._require_manager_permission(auth)
         self._disabled_user_check(user)
-        adding_member = not self.is_member(user)
-        if self.is_manager(user):
+        role = self._role_of(user)
+        if role == MANAGER:
             return False
 
-        if not self.is_member(user):
+        if role is None:
             self.add_log(
                 OSFGroupLog.MANAGER_ADDED,
                 params={
@@ -207,7 +270,7 @@ class OSFGroup(GuardianMixin, Loggable, base.ObjectIDMixin, base.BaseModel):
         self.member_group.user_set.add(user)
         self.update_search()
 
-        if adding_member:
+        if role is None:
             self.send_member_email(user, MANAGER, auth)
 
     def add_unregistered_member(self, fullname, email, auth, role=MEMBER):
@@ -259,10 +322,10 @@ class OSFGroup(GuardianMixin, Loggable, base.ObjectIDMixin, base.BaseModel):
         # For the manager and member Django group attached to the OSFGroup,
         # add the new user to the group, and remove the old.  This
         # will give the new user the appropriate permissions to the OSFGroup
-        for group_name in self.groups.keys():
-            if self.get_group(group_name).user_set.filter(id=old.id).exists():
-                self.get_group(group_name).user_set.remove(old)
-                self.get_group(group_name).user_set.add(new)
+        for group in (self.manager_group, self.member_group):
+            if group.user_set.filter(id=old.id).exists():
+                group.user_set.remove(old)
+                group.user_set.add(new)
 
         self.update_search()
         return True
@@ -303,7 +366,11 @@ class OSFGroup(GuardianMixin, Loggable, base.ObjectIDMixin, base.BaseModel):
         :param auth: Auth object
         """
         self._require_manager_permission(auth)
-        new_name = sanitize.strip_html(name)
+        if isinstance(name, basestring) and not HTML_SPECIAL_CHARS_RE.search(name):
+            # Nothing for bleach to sanitize
+            new_name = name
+        else:
+            new_name = sanitize.strip_html(name)
         # Title hasn't changed after sanitzation, bail out
         if self.name == new_name:
             return False
@@ -338,8 +405,7 @@ class OSFGroup(GuardianMixin, Loggable, base.ObjectIDMixin, base.BaseModel):
             return self.update_group_permissions_to_node(node, permission, auth)
 
         permissions = self._get_node_group_perms(node, permission)
-        for perm in permissions:
-            assign_perm(perm, self.member_group, node)
+        self._assign_node_perms(node, permissions)
 
         params = {
             'group': self._id,
@@ -355,8 +421,11 @@ class OSFGroup(GuardianMixin, Loggable, base.ObjectIDMixin, base.BaseModel):
         self.add_corresponding_node_log(node, NodeLog.GROUP_ADDED, params, auth)
         node.update_search()
 
-        for user in self.members:
+        member_ids = []
+        for user in self.members.iterator():
             group_signals.group_added_to_node.send(self, node=node, user=user, permission=permission, auth=auth)
+            member_ids.append(user.id)
+        group_signals.group_added_to_node_bulk.send(self, node=node, user_ids=member_ids, permission=permission, auth=auth)
 
     def update_group_permissions_to_node(self, node, permission=WRITE, auth=None):
         """Updates the OSF Group permissions to the node.  Called from node model.
@@ -365,14 +434,12 @@ class OSFGroup(GuardianMixin, Loggable, base.ObjectIDMixin, base.BaseModel):
         :param str Highest permission to grant, 'read', 'write', or 'admin'
         :param auth: Auth object
         """
-        if self.get_permission_to_node(node) == permission:
+        current_perms = set(get_group_perms(self.member_group, node))
+        if current_perms and reduce_permissions(current_perms) == permission:
             return False
         permissions = self._get_node_group_perms(node, permission)
-        to_remove = set(get_perms(self.member_group, node)).difference(permissions)
-        for perm in to_remove:
-            remove_perm(perm, self.member_group, node)
-        for perm in permissions:
-            assign_perm(perm, self.member_group, node)
+        self._remove_node_perms(node, current_perms.difference(permissions))
+        self._assign_node_perms(node, set(permissions).difference(current_perms))
         params = {
             'group': self._id,
             'node': node._id,
@@ -393,8 +460,7 @@ class OSFGroup(GuardianMixin, Loggable, base.ObjectIDMixin, base.BaseModel):
         """
         if not self.get_permission_to_node(node):
             return False
-        for perm in node.groups[ADMIN]:
-            remove_perm(perm, self.member_group, node)
+        self._remove_node_perms(node, node.groups[ADMIN])
         params = {
             'group': self._id,
             'node': node._id,
@@ -407,9 +473,11 @@ class OSFGroup(GuardianMixin, Loggable, base.ObjectIDMixin, base.BaseModel):
         self.add_corresponding_node_log(node, NodeLog.GROUP_REMOVED, params, auth)
         node.update_search()
 
-        for user in self.members:
+        member_ids = []
+        for user in self.members.iterator():
             node.disconnect_addons(user, auth)
-            project_signals.contributor_removed.send(node, user=user)
+            member_ids.append(user.id)
+        project_signals.contributor_removed_bulk.send(node, user_ids=member_ids)
 
     def get_permission_to_node(self, node):
         """
@@ -442,8 +510,14 @@ class OSFGroup(GuardianMixin, Loggable, base.ObjectIDMixin, base.BaseModel):
         members = list(self.members.values_list('id', flat=True))
         nodes = self.nodes
 
-        self.member_group.delete()
-        self.manager_group.delete()
+        member_group = self.member_group
+        manager_group = self.manager_group
+        # Clear the cached Django groups before deleting them
+        del self.member_group
+        del self.manager_group
+
+        member_group.delete()
+        manager_group.delete()
         self.delete()
         self.update_search(deleted_id=group_id)
 
@@ -480,6 +554,59 @@ class OSFGroup(GuardianMixin, Loggable, base.ObjectIDMixin, base.BaseModel):
             },
             auth=auth)
 
+    @classmethod
+    @contextmanager
+    def log_batch(cls):
+        """ Buffers the OSFGroupLogs and corresponding NodeLogs created inside the block,
+        and writes them with a single bulk_create per log model on exit.
+
+        with OSFGroup.log_batch():
+            for user in users:
+                group.make_member(user, auth=auth)
+        """
+        if getattr(_log_buffer, 'logs', None) is not None:
+            # Already batching, the outermost block writes the logs
+            yield
+            return
+
+        _log_buffer.logs = logs = []
+        try:
+            yield
+        finally:
+            # Logs buffered by a block that raised are dropped along with its other writes
+            _log_buffer.logs = None
+        group_logs = [log for log in logs if isinstance(log, OSFGroupLog)]
+        OSFGroupLog.objects.bulk_create(group_logs)
+        NodeLog.objects.bulk_create([log for log in logs if isinstance(log, NodeLog)])
+
+        # OSFGroupLog.created is auto_now_add, so bulk_create restamps it on INSERT.
+        # Point each group's last_logged at its newest log, like _complete_add_log
+        newest_logs = {}
+        for log in group_logs:
+            if log.group_id not in newest_logs or log.created > newest_logs[log.group_id].created:
+                newest_logs[log.group_id] = log
+        for group_id, log in newest_logs.items():
+            log.group.last_logged = log.created
+            cls.objects.filter(id=group_id).update(last_logged=log.created)
+
+    @staticmethod
+    def _buffer_log(loggable, log, action, user, save):
+        """ Defers writing the log until the end of log_batch.  Only the log INSERT is deferred,
+        the logged object is still updated and saved right away.
+        """
+        # bulk_create skips BaseModel.save, so validate the log here instead
+        try:
+            log.full_clean()
+        except ValidationError as err:
+            raise OSFValidationError(*err.args)
+
+        if isinstance(log, OSFGroupLog):
+            # Provisional, log_batch realigns last_logged once the log is inserted
+            log.created = timezone.now()
+        _log_buffer.logs.append(log)
+        loggable.last_logged = log.date if isinstance(log, NodeLog) else log.created
+        loggable._finish_add_log(action, user, save)
+
     def add_corresponding_node_log(self, node, action, params, auth):
         """ Used for logging OSFGroup-related action to nodes - for example,
         adding a group to a node.
@@ -488,12 +615,18 @@ class OSFGroup(GuardianMixin, Loggable, base.ObjectIDMixin, base.BaseModel):
         :param action: string, Node log action
         :param params: dict, log params
         """
-        node.add_log(
-            action=action,
-            params=params,
-            auth=auth,
-            save=True
-        )
+        if getattr(_log_buffer, 'logs', None) is None:
+            return node.add_log(
+                action=action,
+                params=params,
+                auth=auth,
+                save=True
+            )
+
+        user = auth.user if auth else None
+        log = node._build_log(action, params, user)
+        self._buffer_log(node, log, action, user, save=True)
+        return log
 
     def add_log(self, action, params, auth, log_date=None, save=True):
         """Create OSFGroupLog
@@ -509,6 +642,10 @@ class OSFGroup(GuardianMixin, Loggable, base.ObjectIDMixin, base.BaseModel):
             params=params, group=self
         )
 
+        if getattr(_log_buffer, 'logs', None) is not None:
+            self._buffer_log(self, log, action, user, save)
+            return log
+
         log.save()
 
         self._complete_add_log(log, action, user, save)
@@ -1580,8 +1580,8 @@ class OSFUser(DirtyFieldsMixin, GuidMixin, BaseModel, AbstractBaseUser, Permissi
         try:
             return self.unclaimed_records[project_id]
         except KeyError:  # reraise as ValueError
-            raise ValueError('No unclaimed record for user {self._id} on node {project_id}'
-                                .format(**locals()))
+            raise ValueError('No unclaimed record for user {user_id} on node {project_id}'
+                                .format(user_id=self._id, project_id=project_id))
 
     def get_claim_url(self, project_id, external=False):
         """Return the URL that an unclaimed user should use to claim their
@@ -1598,7 +1598,7 @@ class OSFUser(DirtyFieldsMixin, GuidMixin, BaseModel, AbstractBaseUser, Permissi
         unclaimed_record = self.get_unclaimed_record(project_id)
         token = unclaimed_record['token']
         return '{base_url}user/{uid}/{project_id}/claim/?token={token}'\
-                    .format(**locals())
+                    .format(base_url=base_url, uid=uid, project_id=project_id, token=token)
 
     def is_affiliated_with_institution(self, institution):
         """Return if this user is affiliated with ``institution``."""
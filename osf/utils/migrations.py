@@ -12,6 +12,7 @@ from django.db.migrations.operations.base import Operation
 
 from website import settings
 from osf.models import NodeLicense, RegistrationSchema
+from osf.models.metaschema import get_schema_hash
 from website.project.metadata.schemas import OSF_META_SCHEMAS
 
 logger = logging.getLogger(__file__)
@@ -146,13 +147,19 @@ def ensure_schemas(*args):
         except Exception:
             # Working outside a migration
             from osf.models import RegistrationSchema
+    # update_or_create skips AbstractSchema.save, so keep schema_hash current here
+    # once the historical model has the column
+    has_schema_hash = any(field.name == 'schema_hash' for field in RegistrationSchema._meta.get_fields())
     for schema in OSF_META_SCHEMAS:
+        defaults = {
+            'schema': schema,
+        }
+        if has_schema_hash:
+            defaults['schema_hash'] = get_schema_hash(schema)
         schema_obj, created = RegistrationSchema.objects.update_or_create(
             name=schema['name'],
             schema_version=schema.get('version', 1),
-            defaults={
-                'schema': schema,
-            }
+            defaults=defaults
         )
         schema_count += 1
 
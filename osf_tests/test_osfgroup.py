@@ -1,7 +1,7 @@
 import mock
 import pytest
 import time
-from django.contrib.auth.models import Group
+from django.contrib.auth.models import Group, Permission
 from django.core.exceptions import ValidationError
 
 from addons.github.tests import factories
@@ -284,6 +284,16 @@ class TestOSFGroup:
 
         assert osf_group.name == new_name
 
+    def test_set_group_name_strips_html(self, manager, osf_group):
+        osf_group.set_group_name('<b>Platform</b> Team', Auth(manager))
+        assert osf_group.name == 'Platform Team'
+
+        osf_group.set_group_name('Platform & Infrastructure', Auth(manager))
+        assert osf_group.name == 'Platform &amp; Infrastructure'
+
+        osf_group.set_group_name('Platform\x01Team', Auth(manager))
+        assert osf_group.name == 'Platform?Team'
+
     def test_remove_group(self, manager, member, osf_group):
         osf_group_name = osf_group.name
         manager_group_name = osf_group.manager_group.name
@@ -530,6 +540,11 @@ class TestNodeGroups:
         assert len(get_all_node_subscriptions(member, project)) == 2
         assert len(get_all_node_subscriptions(user_two, project)) == 2
 
+    def test_assign_node_perms_unknown_permission(self, osf_group, project):
+        with pytest.raises(Permission.DoesNotExist):
+            osf_group._assign_node_perms(project, ['read_node', 'fly_node'])
+        assert osf_group.get_permission_to_node(project) is None
+
     @mock.patch('website.osf_groups.views.mails.send_mail')
     def test_add_group_to_node_throttle(self, mock_send_mail, osf_group, manager, member, project):
         throttle = 100
@@ -930,6 +945,44 @@ class TestOSFGroupLogging:
         assert node_log.params['group'] == group._id
         assert node_log.params['node'] == project._id
 
+    def test_log_batch(self, project, manager, member, user_two):
+        group = OSFGroup.objects.create(name='My Lab', creator_id=manager.id)
+        assert group.logs.count() == 2
+
+        with OSFGroup.log_batch():
+            group.make_member(member, Auth(manager))
+            group.make_member(user_two, Auth(manager))
+            project.add_osf_group(group, WRITE, Auth(manager))
+            # Logs aren't written until the end of the batch
+            assert group.logs.count() == 2
+            assert not project.logs.filter(action=NodeLog.GROUP_ADDED).exists()
+
+        assert group.logs.count() == 5
+        assert group.logs.first().action == OSFGroupLog.NODE_CONNECTED
+        node_log = project.logs.get(action=NodeLog.GROUP_ADDED)
+        assert node_log.user == manager
+        assert node_log.original_node == project
+        assert node_log.params['group'] == group._id
+        project.reload()
+        assert project.last_logged == node_log.date
+        newest_log_created = group.logs.first().created
+        assert group.last_logged == newest_log_created
+        group.reload()
+        assert group.last_logged == newest_log_created
+
+    def test_log_batch_drops_logs_on_error(self, manager, member, user_two):
+        group = OSFGroup.objects.create(name='My Lab', creator_id=manager.id)
+
+        with pytest.raises(ValueError):
+            with OSFGroup.log_batch():
+                group.make_member(member, Auth(manager))
+                raise ValueError('Done Testing')
+
+        assert group.logs.count() == 2
+        # Logging is unbuffered again after the failed block
+        group.make_member(user_two, Auth(manager))
+        assert group.logs.count() == 3
+
 
 class TestRemovingContributorOrGroupMembers:
     """
@@ -1095,6 +1148,45 @@ class TestRemovingContributorOrGroupMembers:
         assert file.checkout is not None
         assert len(get_all_node_subscriptions(user_two, project)) == 2
 
+    def test_remove_osf_group_checks_in_member_files(self, project, user_two, user_three, member, request_context, file):
+        member_file = OsfStorageFile.create(
+            target_object_id=project.id,
+            target_content_type=ContentType.objects.get_for_model(project),
+            path='/member_file.txt',
+            name='member_file.txt',
+            materialized_path='/member_file.txt',
+            checkout=member)
+        member_file.save()
+        group = OSFGroupFactory(creator=user_three)
+        group.make_member(user_two)
+        group.make_member(member)
+        project.add_osf_group(group, WRITE)
+        # Manually removing contributor
+        contrib_obj = project.contributor_set.get(user=user_two)
+        contrib_obj.delete()
+        project.clear_permissions(user_two)
+
+        project.remove_osf_group(group)
+
+        file.reload()
+        member_file.reload()
+        assert file.checkout is None
+        assert member_file.checkout is None
+
+    def test_remove_osf_group_keeps_contributor_subscriptions(self, project, user_two, user_three, member, request_context):
+        group = OSFGroupFactory(creator=user_three)
+        group.make_member(user_two)
+        group.make_member(member)
+        project.add_osf_group(group, WRITE)
+        assert len(get_all_node_subscriptions(user_two, project)) == 2
+        assert len(get_all_node_subscriptions(member, project)) == 2
+
+        project.remove_osf_group(group)
+
+        # user_two is still a contributor, member only had access through the group
+        assert len(get_all_node_subscriptions(user_two, project)) == 2
+        assert len(get_all_node_subscriptions(member, project)) == 0
+
     def test_remove_member_also_contributor(self, project, node_settings, user_two, user_three, request_context, file):
         group = OSFGroupFactory(creator=user_two)
         group.make_manager(user_three)
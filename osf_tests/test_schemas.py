@@ -1,7 +1,12 @@
 # -*- coding: utf-8 -*-
 import pytest
+from django.db import connection
+from django.db.migrations.loader import MigrationLoader
 
+from osf.exceptions import ValidationError
 from osf.models import RegistrationSchema
+from osf.models.metaschema import _COMPILED_VALIDATORS, get_schema_hash
+from osf.utils.migrations import ensure_schemas
 
 
 @pytest.mark.django_db
@@ -27,3 +32,67 @@ class TestRegistrationSchema:
 
     def test_get_latest_version(self, schema_name):
         assert RegistrationSchema.objects.get_latest_version(name=schema_name).schema_version == 3
+
+
+@pytest.mark.django_db
+class TestRegistrationSchemaValidation:
+
+    @pytest.fixture()
+    def schema(self):
+        return RegistrationSchema.objects.get(name='Open-Ended Registration', schema_version=2)
+
+    def test_schema_hash_set_on_save(self, schema):
+        schema.save()
+        assert schema.schema_hash == get_schema_hash(schema.schema)
+
+    def test_validate_metadata_caches_compiled_validator(self, schema):
+        schema.validate_metadata({'summary': {'value': 'Summary'}}, required_fields=True)
+        for required_fields in (True, False):
+            for reviewer in (True, False):
+                assert (schema.schema_hash, required_fields, reviewer) in _COMPILED_VALIDATORS
+
+        with pytest.raises(ValidationError):
+            schema.validate_metadata({'summary': {'value': 1}}, required_fields=True)
+
+    def test_equal_schemas_share_compiled_validator(self, schema):
+        copy = RegistrationSchema.objects.create(name='Copy', schema_version=1, schema=schema.schema)
+        assert copy.schema_hash == schema.schema_hash
+
+        schema.validate_metadata({'summary': {'value': 'Summary'}})
+        validator = _COMPILED_VALIDATORS[(schema.schema_hash, False, False)]
+        copy.validate_metadata({'summary': {'value': 'Summary'}})
+        assert _COMPILED_VALIDATORS[(copy.schema_hash, False, False)] is validator
+
+    def test_save_drops_cached_questions(self, schema):
+        assert 'summary' in schema._qid_index
+
+        new_schema = dict(schema.schema, pages=[{'id': 'page1', 'title': 'Page', 'questions': [
+            {'qid': 'description', 'type': 'string', 'format': 'textarea'}
+        ]}])
+        schema.schema = new_schema
+        schema.save()
+        assert list(schema._qid_index.keys()) == ['description']
+
+    def test_save_drops_cached_config(self, schema):
+        assert schema.requires_approval is False
+
+        schema.schema = dict(schema.schema, config={'requiresApproval': True})
+        schema.save(update_fields=['schema'])
+        assert schema.requires_approval is True
+
+    def test_save_without_schema_keeps_hash_and_caches(self, schema):
+        qid_index = schema._qid_index
+        schema.schema_hash = 'unchanged'
+
+        schema.name = 'Renamed'
+        schema.save(update_fields=['name'])
+        assert schema.schema_hash == 'unchanged'
+        assert schema._qid_index is qid_index
+
+    def test_ensure_schemas_sets_schema_hash(self, schema):
+        RegistrationSchema.objects.filter(id=schema.id).update(schema_hash=None)
+        # Historical models, as used by UpdateRegistrationSchemas, bypass AbstractSchema.save
+        state = MigrationLoader(connection).project_state(('osf', '0190_add_schema_hash'))
+        ensure_schemas(state.apps)
+        schema.reload()
+        assert schema.schema_hash == get_schema_hash(schema.schema)
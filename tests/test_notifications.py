@@ -560,6 +560,19 @@ class TestRemoveContributor(OsfTestCase):
         assert_not_in(self.project.creator, self.node.contributors.all())
         assert_in(self.project.creator, self.node_subscription.email_transactional.all())
 
+    def test_remove_contributors_from_subscriptions_keeps_users_with_access(self):
+        other = factories.UserFactory()
+        self.project.add_contributor(contributor=other, permissions=permissions.READ)
+        self.project.save()
+        # Manually removing contributor
+        self.project.contributor_set.get(user=self.contributor).delete()
+        self.project.clear_permissions(self.contributor)
+
+        utils.remove_contributors_from_subscriptions(self.project, [self.contributor.id, other.id])
+        self.subscription.reload()
+        assert_not_in(self.contributor, self.subscription.email_transactional.all())
+        assert_in(other, self.subscription.email_transactional.all())
+
     def test_remove_contributor_signal_called_when_contributor_is_removed(self):
         with capture_signals() as mock_signals:
             self.project.remove_contributor(self.contributor, auth=Auth(self.project.creator))
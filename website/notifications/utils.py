@@ -63,17 +63,40 @@ def remove_contributor_from_subscriptions(node, user):
     """ Remove contributor from node subscriptions unless the user is an
         admin on any of node's parent projects.
     """
+    remove_contributors_from_subscriptions(node, [user.id])
+
+
+@signals.contributor_removed_bulk.connect
+def remove_contributors_from_subscriptions(node, user_ids):
+    """ Remove contributors from node subscriptions, leaving out users who still
+        have permissions to the node or are an admin on any of node's parent projects.
+    """
+    NotificationSubscription = apps.get_model('osf.NotificationSubscription')
+    OSFUser = apps.get_model('osf.OSFUser')
     Preprint = apps.get_model('osf.Preprint')
     # Preprints don't have subscriptions at this time
     if isinstance(node, Preprint):
         return
 
-    # If user still has permissions through being a contributor or group member, or has
+    # If a user still has permissions through being a contributor or group member, or has
     # admin perms on a parent, don't remove their subscription
-    if not(node.is_contributor_or_group_member(user)) and user._id not in node.admin_contributor_or_group_member_ids:
-        node_subscriptions = get_all_node_subscriptions(user, node)
-        for subscription in node_subscriptions:
-            subscription.remove_user_from_subscription(user)
+    admin_ids = set(node.admin_contributor_or_group_member_ids)
+    users = [
+        user for user in OSFUser.objects.filter(id__in=user_ids)
+        if user._id not in admin_ids and not node.is_contributor_or_group_member(user)
+    ]
+    if not users:
+        return
+
+    node_subscriptions = NotificationSubscription.objects.filter(
+        Q(none__in=users) |
+        Q(email_digest__in=users) |
+        Q(email_transactional__in=users),
+        user__isnull=True,
+        node=node,
+    ).distinct()
+    for subscription in node_subscriptions:
+        subscription.remove_users_from_subscription(users)
 
 
 @signals.node_deleted.connect
@@ -452,6 +475,14 @@ def subscribe_user_to_notifications(node, user):
     """ Update the notification settings for the creator or contributors
     :param user: User to subscribe to notifications
     """
+    subscribe_users_to_notifications(node, [user])
+
+
+def subscribe_users_to_notifications(node, users):
+    """ Update the notification settings for several users at once, loading
+    and saving each node subscription a single time
+    :param users: Users to subscribe to notifications
+    """
     NotificationSubscription = apps.get_model('osf.NotificationSubscription')
     Preprint = apps.get_model('osf.Preprint')
     if isinstance(node, Preprint):
@@ -470,28 +501,40 @@ def subscribe_user_to_notifications(node, user):
     notification_type = 'email_transactional'
     target_id = node._id
 
-    if user.is_registered:
-        for event in events:
-            event_id = to_subscription_key(target_id, event)
-            global_event_id = to_subscription_key(user._id, 'global_' + event)
-            global_subscription = NotificationSubscription.load(global_event_id)
-
-            subscription = NotificationSubscription.load(event_id)
+    users = [user for user in users if user.is_registered]
+    if not users:
+        return
+    parent_node = node.parent_node
+
+    for event in events:
+        event_id = to_subscription_key(target_id, event)
+        subscription = NotificationSubscription.load(event_id)
+        global_subscriptions = {
+            global_subscription._id: global_subscription
+            for global_subscription in NotificationSubscription.objects.filter(
+                _id__in=[to_subscription_key(user._id, 'global_' + event) for user in users]
+            )
+        }
 
+        for user in users:
             # If no subscription for component and creator is the user, do not create subscription
             # If no subscription exists for the component, this means that it should adopt its
             # parent's settings
-            if not(node and node.parent_node and not subscription and node.creator == user):
-                if not subscription:
-                    subscription = NotificationSubscription(_id=event_id, owner=node, event_name=event)
-                    # Need to save here in order to access m2m fields
-                    subscription.save()
-                if global_subscription:
-                    global_notification_type = get_global_notification_type(global_subscription, user)
-                    subscription.add_user_to_subscription(user, global_notification_type)
-                else:
-                    subscription.add_user_to_subscription(user, notification_type)
+            if parent_node and not subscription and node.creator == user:
+                continue
+            if not subscription:
+                subscription = NotificationSubscription(_id=event_id, owner=node, event_name=event)
+                # Need to save here in order to access m2m fields
                 subscription.save()
+            global_subscription = global_subscriptions.get(to_subscription_key(user._id, 'global_' + event))
+            if global_subscription:
+                global_notification_type = get_global_notification_type(global_subscription, user)
+                subscription.add_user_to_subscription(user, global_notification_type, save=False)
+            else:
+                subscription.add_user_to_subscription(user, notification_type, save=False)
+
+        if subscription:
+            subscription.save()
 
 
 def format_user_and_project_subscriptions(user):
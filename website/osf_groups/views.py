@@ -1,17 +1,20 @@
 import logging
 
+from django.apps import apps
+
 from framework.utils import get_timestamp, throttle_period_expired
 
 from website import mails, settings
 from website.notifications.exceptions import InvalidSubscriptionError
 from website.notifications.utils import (
     check_if_all_global_subscriptions_are_none,
-    subscribe_user_to_notifications,
+    subscribe_users_to_notifications,
 )
 from website.osf_groups.signals import (
     unreg_member_added,
     member_added,
     group_added_to_node,
+    group_added_to_node_bulk,
 )
 logger = logging.getLogger(__name__)
 
@@ -129,10 +132,11 @@ def notify_added_node_group_member(group, node, user, permission, auth, throttle
         user.group_connected_email_records[group._id]['last_sent'] = get_timestamp()
         user.save()
 
-@group_added_to_node.connect
-def subscribe_group_member(group, node, user, permission, auth, throttle=None):
+@group_added_to_node_bulk.connect
+def subscribe_group_members(group, node, user_ids, permission, auth):
+    OSFUser = apps.get_model('osf.OSFUser')
     try:
-        subscribe_user_to_notifications(node, user)
+        subscribe_users_to_notifications(node, OSFUser.objects.filter(id__in=user_ids))
     except InvalidSubscriptionError as err:
-        logger.warn('Skipping subscription of user {} to node {}'.format(user, node._id))
+        logger.warn('Skipping subscription of group {} members to node {}'.format(group._id, node._id))
         logger.warn('Reason: {}'.format(str(err)))
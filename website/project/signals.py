@@ -6,6 +6,7 @@ mention_added = signals.signal('mention-added')
 contributor_added = signals.signal('contributor-added')
 project_created = signals.signal('project-created')
 contributor_removed = signals.signal('contributor-removed')
+contributor_removed_bulk = signals.signal('contributor-removed-bulk')
 unreg_contributor_added = signals.signal('unreg-contributor-added')
 write_permissions_revoked = signals.signal('write-permissions-revoked')
 node_deleted = signals.signal('node-deleted')
@@ -12,6 +12,7 @@ ALL_SIGNALS = [
     project.unreg_contributor_added,
     project.contributor_added,
     project.contributor_removed,
+    project.contributor_removed_bulk,
     project.privacy_set_public,
     project.node_deleted,
     auth.user_confirmed,